@@ -0,0 +1,224 @@
+import json
+import os
+import re
+import time
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt, QObject, QUrl, QTimer, QSize, Signal
+from PySide6.QtWebEngineCore import QWebEngineLoadingInfo
+from PySide6.QtWebEngineWidgets import QWebEngineView
+
+DEFAULT_SIZE = QSize(1280, 800)
+SETTLE_MS = 300  # let the compositor produce a frame after the load finished before grabbing
+ERR_ABORTED = -3  # Chromium net error for a load cancelled by a newer navigation
+
+
+def read_url_list(path):
+    """One URL (or local file path) per line; blank lines and '#' comments are skipped."""
+    urls = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                urls.append(line)
+    return urls
+
+
+class RenderJob:
+    def __init__(self, index: int, url: str, output: str):
+        self.index = index
+        self.url = url
+        self.output = output
+        self.attempts = 0
+        self.status = "pending"  # pending | ok | failed
+        self.error = None
+        self.elapsed_ms = None
+
+    def to_dict(self):
+        return {
+            "url": self.url,
+            "output": self.output,
+            "status": self.status,
+            "attempts": self.attempts,
+            "error": self.error,
+            "elapsed_ms": self.elapsed_ms,
+        }
+
+
+class RenderWorker(QObject):
+    """One offscreen view, reused for every job it is handed."""
+    done = Signal(object, bool, str)  # job, success, error
+
+    def __init__(self, fmt: str, size: QSize, timeout_ms: int):
+        super().__init__()
+        self.fmt = fmt
+        self.timeout_ms = timeout_ms
+
+        # Same (default) profile an interactive Tile uses, so cookies/cache/settings match
+        self.view = QWebEngineView()
+        self.view.setAttribute(Qt.WA_DontShowOnScreen)
+        self.view.resize(size)
+        self.view.show()
+        self.view.page().loadingChanged.connect(self._on_loading_changed)
+        self.view.urlChanged.connect(self._on_url_changed)
+        self.view.page().pdfPrintingFinished.connect(self._on_pdf_finished)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(lambda: self._finish(False, f"timed out after {self.timeout_ms} ms"))
+
+        self.job = None
+        self._token = 0  # bumped per attempt; late callbacks from older attempts are ignored
+        self._attempt_urls = set()  # URLs (incl. redirects) loaded by the current attempt
+        self._loaded = False
+
+    def run(self, job: RenderJob):
+        self.job = job
+        self._token += 1
+        job.attempts += 1
+        url = QUrl.fromUserInput(job.url, os.getcwd())
+        self._attempt_urls = {url.toString()}
+        self._loaded = False
+        self._timer.start(self.timeout_ms)
+        self.view.setUrl(url)
+
+    def _on_url_changed(self, url):
+        if self.job is not None and not self._loaded:
+            self._attempt_urls.add(url.toString())  # follow redirects
+
+    def _on_loading_changed(self, info: QWebEngineLoadingInfo):
+        # Only finishes of this attempt's own navigation count; the previous attempt's
+        # aborted load may report after the new one started.
+        if self.job is None or self._loaded or info.url().toString() not in self._attempt_urls:
+            return
+        status = info.status()
+        if status in (QWebEngineLoadingInfo.LoadStartedStatus, QWebEngineLoadingInfo.LoadStoppedStatus):
+            return
+        if status == QWebEngineLoadingInfo.LoadFailedStatus:
+            if info.errorCode() == ERR_ABORTED:
+                return
+            self._finish(False, f"load failed: {info.errorString()}")
+            return
+        self._loaded = True
+        token = self._token
+        if self.fmt == "pdf":
+            self.view.page().printToPdf(self.job.output)
+        else:
+            QTimer.singleShot(SETTLE_MS, lambda: self._grab(token))
+
+    def _grab(self, token):
+        if self.job is None or token != self._token:
+            return
+        ok = self.view.grab().save(self.job.output, "PNG")
+        self._finish(ok, "" if ok else "could not write image")
+
+    def _on_pdf_finished(self, path, success):
+        if self.job is None or path != self.job.output:
+            return
+        self._finish(success, "" if success else "could not write pdf")
+
+    def _finish(self, success, error):
+        if self.job is None:
+            return
+        self._timer.stop()
+        job, self.job = self.job, None
+        if not success:
+            self.view.stop()  # its late "stopped" report is ignored by the next attempt
+        self.done.emit(job, success, error)
+
+
+class BatchRenderer(QObject):
+    """
+    Render a list of URLs to PNG/PDF with N concurrent offscreen views.
+    Failed or timed-out jobs are retried up to `retries` times, then
+    recorded as failed in the JSON manifest.
+    """
+    finished = Signal()
+
+    def __init__(self, urls, out_dir, fmt="png", jobs=4, timeout=30.0, retries=1,
+                 manifest_path=None, size: QSize = DEFAULT_SIZE):
+        super().__init__()
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.retries = max(0, retries)
+        self.manifest_path = manifest_path or os.path.join(out_dir, "manifest.json")
+
+        os.makedirs(out_dir, exist_ok=True)
+        self.jobs = [RenderJob(i, url, os.path.join(out_dir, self._file_name(i, url))) for i, url in enumerate(urls)]
+        self.pending = list(self.jobs)
+        self._started = {}
+
+        self.workers = []
+        for _ in range(max(1, min(jobs, len(self.jobs) or 1))):
+            w = RenderWorker(fmt, size, int(timeout * 1000))
+            w.done.connect(lambda job, ok, err, worker=w: self._on_done(worker, job, ok, err))
+            self.workers.append(w)
+        self._idle = list(self.workers)
+
+    def _file_name(self, index, url):
+        host = QUrl.fromUserInput(url, os.getcwd()).host() or "page"
+        return f"{index:04d}-{re.sub(r'[^A-Za-z0-9.-]+', '_', host)}.{self.fmt}"
+
+    def start(self):
+        self.t0 = time.monotonic()
+        if not self.jobs:
+            self._write_manifest()
+            self.finished.emit()
+            return
+        self._dispatch()
+
+    def _dispatch(self):
+        while self._idle and self.pending:
+            worker = self._idle.pop()
+            job = self.pending.pop(0)
+            self._started[job.index] = time.monotonic()
+            worker.run(job)
+
+    def _on_done(self, worker, job, ok, error):
+        job.elapsed_ms = int((time.monotonic() - self._started.pop(job.index)) * 1000)
+        if ok:
+            job.status, job.error = "ok", None
+        elif job.attempts <= self.retries:
+            job.error = error
+            self.pending.append(job)
+        else:
+            job.status, job.error = "failed", error
+        print(f"[{job.status if job.status != 'pending' else 'retry'}] {job.url} ({job.elapsed_ms} ms)"
+              + (f": {error}" if error else ""))
+
+        self._idle.append(worker)
+        self._dispatch()
+        if len(self._idle) == len(self.workers) and not self.pending:
+            self._write_manifest()
+            self.finished.emit()
+
+    def _write_manifest(self):
+        data = {
+            "format": self.fmt,
+            "workers": len(self.workers),
+            "elapsed_ms": int((time.monotonic() - self.t0) * 1000),
+            "ok": sum(1 for j in self.jobs if j.status == "ok"),
+            "failed": sum(1 for j in self.jobs if j.status == "failed"),
+            "jobs": [j.to_dict() for j in self.jobs],
+        }
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    def failed_count(self):
+        return sum(1 for j in self.jobs if j.status != "ok")
+
+
+def run_batch(args, qt_args):
+    """Entry point for `main.py --batch`; returns the process exit code."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication(qt_args)
+    urls = read_url_list(args.batch)
+    renderer = BatchRenderer(
+        urls, args.out, fmt=args.format, jobs=args.jobs, timeout=args.timeout,
+        retries=args.retries, manifest_path=args.manifest,
+        size=QSize(args.width, args.height),
+    )
+    renderer.finished.connect(app.quit)
+    QTimer.singleShot(0, renderer.start)
+    app.exec()
+    print(f"Rendered {len(urls) - renderer.failed_count()}/{len(urls)} pages to {args.out}")
+    return 1 if renderer.failed_count() else 0
@@ -0,0 +1,179 @@
+import json
+import os
+import time
+import shiboken6
+from PySide6.QtCore import QObject, QUrl, QTimer, Signal
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PySide6.QtWebSockets import QWebSocket
+from PySide6.QtWebEngineWidgets import QWebEngineView
+
+TRACE_DIR = os.path.join(os.path.dirname(__file__), "traces")
+DEFAULT_TRACE_SECONDS = 5
+DEADLINE_MARGIN_S = 15  # time past the recording allowed for connecting and transferring the data
+
+# Chromium trace categories roughly matching DevTools' "Performance" panel
+TRACE_CATEGORIES = [
+    "-*", "devtools.timeline", "disabled-by-default-devtools.timeline",
+    "disabled-by-default-devtools.timeline.frame", "toplevel", "blink.console",
+    "blink.user_timing", "latencyInfo", "v8.execute", "disabled-by-default-v8.cpu_profiler",
+]
+
+
+def enable_remote_debugging(port: int):
+    """Must run before QApplication is created; binds Chromium's debugger to localhost only."""
+    os.environ["QTWEBENGINE_REMOTE_DEBUGGING"] = f"127.0.0.1:{int(port)}"
+
+
+def debug_port():
+    """Port Chromium's remote debugger listens on, or None if debugging is off."""
+    value = os.environ.get("QTWEBENGINE_REMOTE_DEBUGGING", "")
+    port = value.rsplit(":", 1)[-1]
+    return int(port) if port.isdigit() else None
+
+
+def trace_seconds():
+    try:
+        return max(1, int(os.environ.get("TYLE_TRACE_SECONDS", DEFAULT_TRACE_SECONDS)))
+    except ValueError:
+        return DEFAULT_TRACE_SECONDS
+
+
+class TraceCapture(QObject):
+    """
+    Record a CPU profile ("profile") or a full timeline trace ("trace")
+    of one page through the DevTools protocol, then write it to disk.
+    Profiles open in DevTools' Performance/JavaScript Profiler panels,
+    traces in DevTools or chrome://tracing.
+    """
+    finished = Signal(str)  # output path
+    failed = Signal(str)    # error message
+
+    def __init__(self, view: QWebEngineView, kind="profile", seconds=None, port=None, parent=None):
+        super().__init__(parent)
+        self.view = view
+        self.kind = kind
+        self.seconds = seconds or trace_seconds()
+        self.port = port or debug_port()
+        self.page_url = view.url().toString()
+
+        self._nam = QNetworkAccessManager(self)
+        self._socket = QWebSocket()
+        self._socket.setParent(self)
+        self._socket.connected.connect(self._on_connected)
+        self._socket.textMessageReceived.connect(self._on_message)
+        self._socket.errorOccurred.connect(lambda _: self._fail(self._socket.errorString()))
+
+        self._next_id = 0
+        self._stop_id = None
+        self._trace_events = []
+        self._done = False
+
+        # Overall deadline so a hung debugger connection can't keep the capture alive forever
+        self._deadline = QTimer(self)
+        self._deadline.setSingleShot(True)
+        self._deadline.timeout.connect(lambda: self._fail(f"timed out after {self._deadline.interval() // 1000}s"))
+
+    # ---------------- Flow ----------------
+    def start(self):
+        if self.port is None:
+            self._fail("remote debugging is disabled (start with --debug-port)")
+            return
+        self._deadline.start((self.seconds + DEADLINE_MARGIN_S) * 1000)
+        req = QNetworkRequest(QUrl(f"http://127.0.0.1:{self.port}/json/list"))
+        reply = self._nam.get(req)
+        reply.finished.connect(lambda: self._on_targets(reply))
+
+    def _on_targets(self, reply: QNetworkReply):
+        reply.deleteLater()
+        if reply.error() != QNetworkReply.NoError:
+            self._fail(reply.errorString())
+            return
+        try:
+            targets = json.loads(bytes(reply.readAll().data()).decode("utf-8"))
+        except ValueError as e:
+            self._fail(f"bad target list: {e}")
+            return
+        target = self._find_target(targets)
+        if not target or not target.get("webSocketDebuggerUrl"):
+            self._fail("no debugger target for this tab")
+            return
+        self._socket.open(QUrl(target["webSocketDebuggerUrl"]))
+
+    def _find_target(self, targets):
+        if not shiboken6.isValid(self.view):
+            return None  # tab closed while the target list was fetched
+        pages = [t for t in targets if t.get("type") == "page"]
+        page = self.view.page()
+        # Qt >= 6.6 exposes the page's own target id; fall back to URL matching
+        target_id = page.devToolsId() if hasattr(page, "devToolsId") else ""
+        if target_id:
+            for t in pages:
+                if t.get("id") == target_id:
+                    return t
+        for t in pages:
+            if t.get("url") == self.page_url:
+                return t
+        return None
+
+    def _on_connected(self):
+        if self.kind == "trace":
+            self._send("Tracing.start", {
+                "transferMode": "ReportEvents",
+                "traceConfig": {"includedCategories": TRACE_CATEGORIES},
+            })
+        else:
+            self._send("Profiler.enable")
+            self._send("Profiler.start")
+        QTimer.singleShot(self.seconds * 1000, self._stop)
+
+    def _stop(self):
+        if self._done:
+            return
+        self._stop_id = self._send("Tracing.end" if self.kind == "trace" else "Profiler.stop")
+
+    def _on_message(self, text):
+        try:
+            msg = json.loads(text)
+        except ValueError:
+            return
+        if msg.get("error"):
+            self._fail(msg["error"].get("message", "protocol error"))
+            return
+        method = msg.get("method")
+        if method == "Tracing.dataCollected":
+            self._trace_events.extend(msg.get("params", {}).get("value", []))
+        elif method == "Tracing.tracingComplete":
+            self._write({"traceEvents": self._trace_events})
+        elif self._stop_id is not None and msg.get("id") == self._stop_id and self.kind != "trace":
+            self._write(msg.get("result", {}).get("profile", {}))
+
+    # ---------------- Helpers ----------------
+    def _send(self, method, params=None):
+        self._next_id += 1
+        self._socket.sendTextMessage(json.dumps({"id": self._next_id, "method": method, "params": params or {}}))
+        return self._next_id
+
+    def _write(self, data):
+        ext = "json" if self.kind == "trace" else "cpuprofile"
+        path = os.path.join(TRACE_DIR, f"{self.kind}-{time.strftime('%Y%m%d-%H%M%S')}.{ext}")
+        try:
+            os.makedirs(TRACE_DIR, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except Exception as e:
+            self._fail(str(e))
+            return
+        self._finish()
+        self.finished.emit(path)
+
+    def _fail(self, message):
+        if self._done:
+            return
+        self._finish()
+        self.failed.emit(message)
+
+    def _finish(self):
+        self._done = True
+        self._deadline.stop()
+        self._socket.close()
+        self.deleteLater()
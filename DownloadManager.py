@@ -0,0 +1,333 @@
+import os
+import time
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QPushButton, QScrollArea
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtWebEngineCore import QWebEngineProfile, QWebEngineDownloadRequest
+
+DEFAULT_MAX_PARALLEL = 3
+UPDATE_INTERVAL_MS = 250  # progress is polled at this rate instead of per-chunk signals
+
+
+def _env_int(name, default):
+    try:
+        return max(0, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+class Download:
+    """Book-keeping for one QWebEngineDownloadRequest."""
+
+    def __init__(self, request: QWebEngineDownloadRequest):
+        self.request = request
+        self.state = "queued"     # queued | active | paused | done | failed | cancelled
+        self.throttled = False    # paused by the bandwidth cap, not the user
+        self.last_bytes = 0
+        self.speed = 0.0          # bytes/s, smoothed
+
+    @property
+    def name(self):
+        return self.request.downloadFileName() or self.request.url().fileName() or "download"
+
+    def received(self):
+        return self.request.receivedBytes()
+
+    def total(self):
+        return self.request.totalBytes()
+
+
+class DownloadManager(QObject):
+    """
+    Accepts every download from the given profile and runs at most
+    max_parallel of them at once; the rest wait paused in a FIFO queue.
+    Optional bandwidth cap (bytes/s, 0 = unlimited) is enforced with a
+    token bucket by pausing/resuming the active downloads.
+    """
+    added = Signal(object)    # Download
+    updated = Signal(list)    # [Download] changed since the last tick
+
+    def __init__(self, profile: QWebEngineProfile = None, max_parallel=None, bandwidth_limit=None):
+        super().__init__()
+        self.max_parallel = max_parallel or _env_int("TYLE_MAX_DOWNLOADS", DEFAULT_MAX_PARALLEL) or DEFAULT_MAX_PARALLEL
+        self.bandwidth_limit = bandwidth_limit if bandwidth_limit is not None else _env_int("TYLE_DOWNLOAD_LIMIT_KBPS", 0) * 1024
+        self.downloads = []
+        self._budget = 0.0
+        self._last_tick = time.monotonic()
+        self._dirty = set()
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(UPDATE_INTERVAL_MS)
+        self._timer.timeout.connect(self._tick)
+
+        profile = profile or QWebEngineProfile.defaultProfile()
+        profile.downloadRequested.connect(self.handle_request)
+
+    # ---------------- Requests ----------------
+    def handle_request(self, request: QWebEngineDownloadRequest):
+        dl = Download(request)
+        request.stateChanged.connect(lambda state, d=dl: self._on_state_changed(d, state))
+        # Over the limit: accepted but held back (paused) until a slot frees up
+        if self._active_count() < self.max_parallel:
+            dl.state = "active"
+            dl.throttled = self._over_budget()  # paused once in progress if so
+        self.downloads.append(dl)
+        request.accept()
+        self.added.emit(dl)
+        self._ensure_timer()
+
+    def _on_state_changed(self, dl: Download, state):
+        if state == QWebEngineDownloadRequest.DownloadInProgress:
+            # pause() is ignored before the download is in progress, so re-apply it here
+            if dl.state in ("queued", "paused") or dl.throttled:
+                dl.request.pause()
+            return
+        if state == QWebEngineDownloadRequest.DownloadCompleted:
+            dl.state = "done"
+        elif state == QWebEngineDownloadRequest.DownloadCancelled:
+            dl.state = "cancelled"
+        elif state == QWebEngineDownloadRequest.DownloadInterrupted:
+            dl.state = "failed"
+        else:
+            return
+        dl.speed = 0.0
+        self._dirty.add(dl)
+        self._start_queued()
+        self._flush()
+
+    # ---------------- User actions ----------------
+    def pause(self, dl: Download):
+        if dl.state not in ("active", "queued"):
+            return
+        was_active = dl.state == "active"
+        dl.state = "paused"
+        dl.throttled = False
+        dl.request.pause()
+        self._dirty.add(dl)
+        if was_active:
+            self._start_queued()
+        self._flush()
+
+    def resume(self, dl: Download):
+        if dl.state != "paused":
+            return
+        dl.state = "queued"
+        self._dirty.add(dl)
+        self._start_queued()
+        self._flush()
+
+    def cancel(self, dl: Download):
+        if dl.state in ("done", "failed", "cancelled"):
+            return
+        dl.request.cancel()
+
+    def set_max_parallel(self, n: int):
+        self.max_parallel = max(1, int(n))
+        self._start_queued()
+
+    def set_bandwidth_limit(self, bytes_per_sec: int):
+        self.bandwidth_limit = max(0, int(bytes_per_sec))
+        if not self.bandwidth_limit:
+            self._set_throttled(False)
+
+    # ---------------- Scheduling ----------------
+    def _active_count(self):
+        return sum(1 for d in self.downloads if d.state == "active")
+
+    def _start_queued(self):
+        for dl in self.downloads:
+            if self._active_count() >= self.max_parallel:
+                break
+            if dl.state == "queued":
+                dl.state = "active"
+                dl.last_bytes = dl.received()
+                # Joins as throttled while the bucket is empty; the next tick resumes it
+                dl.throttled = self._over_budget()
+                if not dl.throttled:
+                    dl.request.resume()
+                self._dirty.add(dl)
+        self._ensure_timer()
+
+    def _over_budget(self):
+        return bool(self.bandwidth_limit) and self._budget < 0
+
+    def remove_finished(self):
+        """Forget completed, failed and cancelled downloads; returns the removed ones."""
+        removed = [d for d in self.downloads if d.state in ("done", "failed", "cancelled")]
+        self.downloads = [d for d in self.downloads if d not in removed]
+        return removed
+
+    def _ensure_timer(self):
+        if self._active_count() and not self._timer.isActive():
+            self._last_tick = time.monotonic()
+            self._timer.start()
+
+    def _set_throttled(self, throttled: bool):
+        for dl in self.downloads:
+            if dl.state != "active" or dl.throttled == throttled:
+                continue
+            dl.throttled = throttled
+            if throttled:
+                dl.request.pause()
+            else:
+                dl.request.resume()
+
+    def _tick(self):
+        now = time.monotonic()
+        dt = max(1e-3, now - self._last_tick)
+        self._last_tick = now
+
+        consumed = 0
+        for dl in self.downloads:
+            if dl.state != "active":
+                continue
+            received = dl.received()
+            delta = max(0, received - dl.last_bytes)
+            dl.last_bytes = received
+            consumed += delta
+            dl.speed = 0.7 * dl.speed + 0.3 * (delta / dt)
+            self._dirty.add(dl)
+
+        if self.bandwidth_limit:
+            # Token bucket: refill at the cap, allow at most one second of burst
+            self._budget = min(self.bandwidth_limit, self._budget + self.bandwidth_limit * dt) - consumed
+            self._set_throttled(self._budget < 0)
+
+        self._flush()
+        if not self._active_count():
+            self._timer.stop()
+
+    def _flush(self):
+        if self._dirty:
+            changed = [d for d in self.downloads if d in self._dirty]
+            self._dirty.clear()
+            self.updated.emit(changed)
+
+
+def _format_bytes(n):
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+class DownloadRow(QWidget):
+    def __init__(self, manager: DownloadManager, dl: Download):
+        super().__init__()
+        self.manager = manager
+        self.dl = dl
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(4, 2, 4, 2)
+
+        self.name_label = QLabel(dl.name)
+        self.name_label.setMinimumWidth(200)
+        layout.addWidget(self.name_label)
+
+        self.progress = QProgressBar()
+        self.progress.setTextVisible(False)
+        self.progress.setFixedHeight(8)
+        layout.addWidget(self.progress, 1)
+
+        self.status_label = QLabel()
+        self.status_label.setMinimumWidth(180)
+        layout.addWidget(self.status_label)
+
+        self.pause_btn = QPushButton("⏸")
+        self.pause_btn.setFixedSize(24, 24)
+        self.pause_btn.clicked.connect(self.toggle_pause)
+        layout.addWidget(self.pause_btn)
+
+        self.cancel_btn = QPushButton("×")
+        self.cancel_btn.setObjectName("closeBtn")
+        self.cancel_btn.setFixedSize(24, 24)
+        self.cancel_btn.clicked.connect(lambda: self.manager.cancel(self.dl))
+        layout.addWidget(self.cancel_btn)
+
+        self.refresh()
+
+    def toggle_pause(self):
+        if self.dl.state == "paused":
+            self.manager.resume(self.dl)
+        else:
+            self.manager.pause(self.dl)
+
+    def refresh(self):
+        dl = self.dl
+        received, total = dl.received(), dl.total()
+        if total > 0:
+            self.progress.setRange(0, 1000)
+            self.progress.setValue(int(received * 1000 / total))
+        else:
+            self.progress.setRange(0, 0 if dl.state == "active" else 1)
+
+        size = _format_bytes(received) + (f" / {_format_bytes(total)}" if total > 0 else "")
+        if dl.state == "active":
+            status = f"{size} · {_format_bytes(dl.speed)}/s" + (" (capped)" if dl.throttled else "")
+        else:
+            status = f"{size} · {dl.state}"
+        self.status_label.setText(status)
+
+        finished = dl.state in ("done", "failed", "cancelled")
+        self.pause_btn.setText("▶" if dl.state == "paused" else "⏸")
+        self.pause_btn.setEnabled(not finished)
+        self.cancel_btn.setEnabled(not finished)
+
+
+class DownloadPanel(QWidget):
+    """Collapsible strip listing downloads; refreshed only on the manager's throttled ticks."""
+
+    def __init__(self, manager: DownloadManager):
+        super().__init__()
+        self.setObjectName("DownloadPanel")
+        self.manager = manager
+        self.rows = {}
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(5, 0, 5, 5)
+        layout.setSpacing(0)
+
+        header = QHBoxLayout()
+        header.addWidget(QLabel("Downloads"))
+        header.addStretch()
+        clear_btn = QPushButton("Clear")
+        clear_btn.clicked.connect(self.clear_finished)
+        header.addWidget(clear_btn)
+        layout.addLayout(header)
+
+        self.list_widget = QWidget()
+        self.list_layout = QVBoxLayout(self.list_widget)
+        self.list_layout.setContentsMargins(0, 0, 0, 0)
+        self.list_layout.setSpacing(0)
+        self.list_layout.addStretch()
+
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(self.list_widget)
+        scroll.setFixedHeight(140)
+        layout.addWidget(scroll)
+
+        manager.added.connect(self.add_download)
+        manager.updated.connect(self.refresh)
+        self.setVisible(False)
+
+    def add_download(self, dl: Download):
+        row = DownloadRow(self.manager, dl)
+        self.rows[dl] = row
+        self.list_layout.insertWidget(self.list_layout.count() - 1, row)
+        self.setVisible(True)
+
+    def refresh(self, changed):
+        for dl in changed:
+            row = self.rows.get(dl)
+            if row:
+                row.refresh()
+
+    def clear_finished(self):
+        for dl in self.manager.remove_finished():
+            row = self.rows.pop(dl, None)
+            if row:
+                self.list_layout.removeWidget(row)
+                row.deleteLater()
+
+    def toggle(self):
+        self.setVisible(not self.isVisible())
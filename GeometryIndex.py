@@ -0,0 +1,144 @@
+from PySide6.QtWidgets import QSplitter
+from PySide6.QtCore import Qt, QRect, QPoint
+
+GRID_CELLS = 16  # hit-test grid is GRID_CELLS x GRID_CELLS over the workspace
+
+
+class GeometryIndex:
+    """
+    Tile rectangles in workspace coordinates, derived from the splitter
+    tree and splitter sizes rather than by asking each tile for its geometry.
+    A splitterMoved only recomputes that splitter's subtree; resizes and
+    structural changes mark the whole index stale and it is rebuilt on the
+    next query. Point lookups go through a fixed grid of buckets, so they
+    cost the same regardless of the number of tiles.
+    """
+
+    def __init__(self, workspace):
+        self.workspace = workspace
+        self.tile_rects = {}      # Tile -> QRect
+        self.splitter_rects = {}  # QSplitter -> QRect
+        self._grid = []
+        self._cell_w = self._cell_h = 1
+        self._origin = QPoint(0, 0)
+        self._stale = True
+
+    # ---------------- Maintenance ----------------
+    def invalidate(self):
+        self._stale = True
+
+    def ensure(self):
+        if self._stale:
+            self.rebuild()
+
+    def rebuild(self):
+        root = self.workspace.root_splitter
+        self.tile_rects.clear()
+        self.splitter_rects.clear()
+        self._layout(root, root.geometry())
+        self._rebuild_grid()
+        self._stale = False
+
+    def update_splitter(self, splitter: QSplitter):
+        """Recompute only the subtree under a splitter whose handle moved."""
+        rect = self.splitter_rects.get(splitter)
+        if self._stale or rect is None:
+            self.rebuild()
+            return
+        self._layout(splitter, rect)
+        self._rebuild_grid()
+
+    def _layout(self, widget, rect: QRect):
+        if isinstance(widget, QSplitter):
+            self.splitter_rects[widget] = rect
+            horiz = widget.orientation() == Qt.Horizontal
+            handle = widget.handleWidth()
+            pos = rect.x() if horiz else rect.y()
+            first = True
+            for i, size in enumerate(widget.sizes()):
+                child = widget.widget(i)
+                if child is None or child.isHidden():
+                    continue
+                if not first:
+                    pos += handle
+                first = False
+                if horiz:
+                    child_rect = QRect(pos, rect.y(), size, rect.height())
+                else:
+                    child_rect = QRect(rect.x(), pos, rect.width(), size)
+                self._layout(child, child_rect)
+                pos += size
+        elif hasattr(widget, "tabs"):
+            self.tile_rects[widget] = rect
+
+    def _rebuild_grid(self):
+        area = self.workspace.root_splitter.geometry()
+        self._origin = area.topLeft()
+        self._cell_w = max(1, -(-area.width() // GRID_CELLS))
+        self._cell_h = max(1, -(-area.height() // GRID_CELLS))
+        self._grid = [[] for _ in range(GRID_CELLS * GRID_CELLS)]
+        for tile, r in self.tile_rects.items():
+            if r.width() <= 0 or r.height() <= 0:
+                continue
+            c0, r0 = self._cell(r.left(), r.top())
+            c1, r1 = self._cell(r.right(), r.bottom())
+            for row in range(r0, r1 + 1):
+                for col in range(c0, c1 + 1):
+                    self._grid[row * GRID_CELLS + col].append(tile)
+
+    def _cell(self, x, y):
+        col = (x - self._origin.x()) // self._cell_w
+        row = (y - self._origin.y()) // self._cell_h
+        return min(GRID_CELLS - 1, max(0, col)), min(GRID_CELLS - 1, max(0, row))
+
+    # ---------------- Queries ----------------
+    def rect(self, tile):
+        self.ensure()
+        return self.tile_rects.get(tile)
+
+    def tile_at(self, point: QPoint):
+        """Tile under a point in workspace coordinates, or None."""
+        self.ensure()
+        if not self._grid:
+            return None
+        col, row = self._cell(point.x(), point.y())
+        for tile in self._grid[row * GRID_CELLS + col]:
+            if self.tile_rects[tile].contains(point):
+                return tile
+        return None
+
+    def neighbour(self, tile, direction: str):
+        """
+        Nearest tile in direction ('left', 'right', 'up', 'down').
+        Candidates must lie beyond the tile's edge; tiles overlapping it on the
+        other axis win, then the smallest edge gap, then the closest centre.
+        """
+        self.ensure()
+        cur = self.tile_rects.get(tile)
+        if cur is None:
+            return None
+        horiz = direction in ("left", "right")
+        best, best_key = None, None
+        for other, r in self.tile_rects.items():
+            if other is tile or r.width() <= 0 or r.height() <= 0:
+                continue
+            if direction == "left":
+                gap = cur.left() - r.right()
+            elif direction == "right":
+                gap = r.left() - cur.right()
+            elif direction == "up":
+                gap = cur.top() - r.bottom()
+            else:
+                gap = r.top() - cur.bottom()
+            if gap <= 0:
+                continue
+            if horiz:
+                overlap = min(cur.bottom(), r.bottom()) - max(cur.top(), r.top())
+                offset = abs(cur.center().y() - r.center().y())
+            else:
+                overlap = min(cur.right(), r.right()) - max(cur.left(), r.left())
+                offset = abs(cur.center().x() - r.center().x())
+            key = (overlap <= 0, gap, offset)
+            if best_key is None or key < best_key:
+                best, best_key = other, key
+        return best
@@ -0,0 +1,118 @@
+import itertools
+import os
+from PySide6.QtWidgets import QSplitter
+from PySide6.QtCore import QObject, QTimer, QCoreApplication, QEvent
+import shiboken6
+
+KINDS = ("Tile", "QWebEngineView", "QWebEnginePage", "QSplitter")
+
+
+def leak_check_enabled():
+    return os.environ.get("TYLE_LEAK_CHECK", "") not in ("", "0")
+
+
+class LeakTracker(QObject):
+    """
+    Debug accounting of live Tiles, web views, pages and splitters.
+    Objects are counted on creation and uncounted on `destroyed`;
+    the totals are compared with what the workspaces' splitter trees
+    say should exist. No references to tracked objects are kept.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.live = {k: set() for k in KINDS}
+        self.created = {k: 0 for k in KINDS}
+        self.workspaces = []      # [shiboken-checked Workspace]
+        self.leak_reports = []    # (operation, {kind: excess})
+        self._seq = itertools.count()
+        self._pending_op = None
+
+    # ---------------- Tracking ----------------
+    def track(self, obj: QObject, kind: str):
+        key = next(self._seq)
+        self.live[kind].add(key)
+        self.created[kind] += 1
+        obj.destroyed.connect(lambda *_, k=kind, key=key: self.live[k].discard(key))
+
+    def register_workspace(self, workspace):
+        self.workspaces.append(workspace)
+
+    def counts(self):
+        return {k: len(v) for k, v in self.live.items()}
+
+    def expected(self):
+        """Counts implied by the current layout of every live workspace."""
+        exp = {k: 0 for k in KINDS}
+        self.workspaces = [ws for ws in self.workspaces if shiboken6.isValid(ws)]
+        for ws in self.workspaces:
+            stack = [ws.root_splitter]
+            while stack:
+                w = stack.pop()
+                if isinstance(w, QSplitter):
+                    exp["QSplitter"] += 1
+                    stack.extend(w.widget(i) for i in range(w.count()))
+                elif hasattr(w, "tabs"):
+                    exp["Tile"] += 1
+                    exp["QWebEngineView"] += w.tabs.count()
+                    exp["QWebEnginePage"] += w.tabs.count()
+        return exp
+
+    # ---------------- Checking ----------------
+    def check(self, operation=""):
+        """Flush pending deleteLater()s, then report anything alive beyond the layout."""
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+        live, exp = self.counts(), self.expected()
+        excess = {k: live[k] - exp[k] for k in KINDS if live[k] > exp[k]}
+        if excess:
+            self.leak_reports.append((operation, excess))
+            detail = ", ".join(f"{k} +{n}" for k, n in excess.items())
+            print(f"Leak check after {operation or 'operation'}: {detail}")
+        return excess
+
+    def schedule_check(self, operation: str):
+        """Check once control returns to the event loop (coalesces bursts of operations)."""
+        if self._pending_op is None:
+            QTimer.singleShot(0, self._run_scheduled)
+        self._pending_op = operation
+
+    def _run_scheduled(self):
+        op, self._pending_op = self._pending_op, None
+        self.check(op)
+
+    def snapshot(self):
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+        return self.counts()
+
+    def assert_no_growth(self, baseline, slack=None):
+        """Raise AssertionError if any live count grew past baseline + slack ({kind: n})."""
+        slack = slack or {}
+        now = self.snapshot()
+        grown = {k: now[k] - baseline.get(k, 0) for k in KINDS
+                 if now[k] > baseline.get(k, 0) + slack.get(k, 0)}
+        if grown:
+            raise AssertionError(f"live object growth: {grown} (baseline {baseline}, now {now})")
+
+
+_tracker = None
+
+
+def leak_tracker():
+    """Shared tracker, or None when TYLE_LEAK_CHECK is not set."""
+    global _tracker
+    if _tracker is None and leak_check_enabled():
+        _tracker = LeakTracker()
+    return _tracker
+
+
+def track(obj, kind):
+    t = leak_tracker()
+    if t:
+        t.track(obj, kind)
+    return obj
+
+
+def structural_change(operation: str):
+    t = leak_tracker()
+    if t:
+        t.schedule_check(operation)
@@ -0,0 +1,183 @@
+import bisect
+import json
+import os
+import time
+from PySide6.QtCore import QObject, QTimer, QUrl
+from PySide6.QtWebEngineCore import QWebEngineScript, QWebEngineLoadingInfo
+from PySide6.QtWebEngineWidgets import QWebEngineView
+
+METRICS_PATH = os.path.join(os.path.dirname(__file__), "load_metrics.json")
+EXPORT_INTERVAL_MS = 60000
+
+# Upper bucket edges in ms (roughly log-spaced); the last bucket is open-ended
+BUCKETS_MS = [25, 50, 100, 200, 400, 800, 1600, 3200, 6400, 12800, 25600]
+ERR_ABORTED = -3  # Chromium net error for a load cancelled by a newer navigation
+PENDING_MAX_AGE_S = 120  # a mark older than this never got its load; drop it instead of sampling
+
+# Navigation Timing (level 2) + paint timing, relative to navigation start
+TIMING_JS = """
+(() => {
+    const n = performance.getEntriesByType('navigation')[0];
+    const out = {};
+    if (n) {
+        out.ttfb = n.responseStart;
+        out.dom_content_loaded = n.domContentLoadedEventEnd;
+        out.load_event = n.loadEventEnd;
+    }
+    for (const p of performance.getEntriesByType('paint')) {
+        if (p.name === 'first-paint') out.first_paint = p.startTime;
+        if (p.name === 'first-contentful-paint') out.first_contentful_paint = p.startTime;
+    }
+    return JSON.stringify(out);
+})()
+"""
+
+
+class Histogram:
+    def __init__(self, edges=BUCKETS_MS):
+        self.edges = edges
+        self.counts = [0] * (len(edges) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value: float):
+        self.counts[bisect.bisect_left(self.edges, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float):
+        """Upper edge of the bucket holding the q-th quantile (max for the open bucket)."""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return self.edges[i] if i < len(self.edges) else self.max
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 1) if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "buckets": self.counts,
+        }
+
+
+class LoadMetrics(QObject):
+    """
+    Collects page-load timings for every attached view and aggregates
+    them into per-domain histograms. `time_to_load` is measured in Python
+    from mark_navigation() (called right before setUrl) to the load finishing;
+    the rest comes from the page's own Navigation/Paint Timing entries.
+    """
+
+    def __init__(self, path=METRICS_PATH, export_interval_ms=EXPORT_INTERVAL_MS):
+        super().__init__()
+        self.path = path
+        self.domains = {}   # host -> {metric: Histogram, "failed": int}
+        self._starts = {}   # view -> monotonic time of the pending setUrl
+        self._dirty = False
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(export_interval_ms)
+        self._timer.timeout.connect(self.export)
+        self._timer.start()
+
+    # ---------------- Views ----------------
+    def attach(self, view: QWebEngineView):
+        view.page().loadingChanged.connect(lambda info, v=view: self._on_loading_changed(v, info))
+        view.destroyed.connect(lambda *_, v=view: self._starts.pop(v, None))
+
+    def mark_navigation(self, view: QWebEngineView):
+        self._starts[view] = time.monotonic()
+
+    @staticmethod
+    def _host(url: QUrl):
+        return url.host() or url.scheme() or "unknown"
+
+    def _on_loading_changed(self, view, info: QWebEngineLoadingInfo):
+        status = info.status()
+        # Loads cut short by a newer navigation (or the user) are neither failures nor samples
+        if status in (QWebEngineLoadingInfo.LoadStartedStatus, QWebEngineLoadingInfo.LoadStoppedStatus):
+            return
+        if status == QWebEngineLoadingInfo.LoadFailedStatus and info.errorCode() == ERR_ABORTED:
+            return
+
+        host = self._host(info.url())
+        # Earlier loads were aborted by the marked setUrl, so the first load to finish
+        # is the marked one, whatever host it redirected to
+        now = time.monotonic()
+        start = self._starts.pop(view, None)
+        if start is not None and now - start > PENDING_MAX_AGE_S:
+            start = None
+
+        if status == QWebEngineLoadingInfo.LoadFailedStatus:
+            self._domain(host)["failed"] += 1
+            self._dirty = True
+            return
+        if start is not None:
+            self._add(host, "time_to_load", (now - start) * 1000)
+        view.page().runJavaScript(TIMING_JS, QWebEngineScript.ScriptWorldId.ApplicationWorld.value,
+                                  lambda result, h=host: self._on_timing(h, result))
+
+    def _on_timing(self, host, result):
+        try:
+            timing = json.loads(result) if result else {}
+        except (TypeError, ValueError):
+            return
+        for name, value in timing.items():
+            if isinstance(value, (int, float)) and value > 0:
+                self._add(host, name, value)
+
+    # ---------------- Aggregation ----------------
+    def _domain(self, host):
+        return self.domains.setdefault(host, {"failed": 0, "metrics": {}})
+
+    def _add(self, host, metric, value_ms):
+        self._domain(host)["metrics"].setdefault(metric, Histogram()).add(value_ms)
+        self._dirty = True
+
+    def to_dict(self):
+        return {
+            "bucket_edges_ms": BUCKETS_MS,
+            "domains": {
+                host: {
+                    "failed": d["failed"],
+                    "metrics": {m: h.to_dict() for m, h in d["metrics"].items()},
+                }
+                for host, d in sorted(self.domains.items())
+            },
+        }
+
+    def export(self):
+        if not self._dirty:
+            return
+        try:
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"exported_at": time.strftime("%Y-%m-%dT%H:%M:%S"), **self.to_dict()}, f, indent=2)
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except Exception as e:
+            print("Failed to export load metrics:", e)
+
+
+_metrics = None
+
+
+def load_metrics():
+    """Shared collector instance (created on first use, needs a QApplication)."""
+    global _metrics
+    if _metrics is None:
+        _metrics = LoadMetrics()
+    return _metrics
@@ -0,0 +1,222 @@
+import json
+import os
+import signal
+import time
+from PySide6.QtWidgets import QMessageBox, QApplication
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtWebEngineCore import QWebEnginePage
+from PySide6.QtWebEngineWidgets import QWebEngineView
+
+STATS_PATH = os.path.join(os.path.dirname(__file__), "crash_stats.json")
+
+RELOAD_BASE_MS = 1000       # first auto-reload delay, doubled per crash in the window
+RELOAD_MAX_MS = 30000
+CRASH_LOOP_LIMIT = 4        # crashes within CRASH_WINDOW_S before we stop reloading
+CRASH_WINDOW_S = 120
+PING_INTERVAL_MS = 2000     # how often visible pages are pinged
+HANG_MISSED_PINGS = 3       # consecutive unanswered intervals => labelled unresponsive
+PROMPT_MISSED_PINGS = 5     # ... => offer to kill the renderer
+LOAD_GRACE_S = HANG_MISSED_PINGS * PING_INTERVAL_MS / 1000  # loads younger than this aren't pinged
+
+
+class _ViewState:
+    def __init__(self):
+        self.crash_times = []
+        self.load_started = None  # monotonic time of the current load, None when idle
+        self.ping_sent = None   # monotonic time of the outstanding ping
+        self.ping_seq = 0
+        self.missed = 0         # ping intervals the outstanding ping has gone unanswered
+        self.hung = False
+        self.prompted = False
+
+
+class RenderSupervisor(QObject):
+    """
+    Watches every registered view for renderer crashes and hangs.
+    Crashed tabs are reloaded with exponential backoff until they crash
+    CRASH_LOOP_LIMIT times within CRASH_WINDOW_S. Hangs are detected by
+    a JavaScript round-trip ping on visible, un-inspected pages while no
+    modal dialog is open; loading pages are pinged too once the load has
+    run past LOAD_GRACE_S, so a renderer stuck in script before onload is
+    still caught. After several missed pings the user is offered
+    to kill the renderer (which in turn triggers the crash path).
+    Per-site counts are kept in crash_stats.json.
+    """
+    # view, state: "crashed" | "reloading" | "gave_up" | "unresponsive" | "responsive"
+    stateChanged = Signal(object, str)
+
+    def __init__(self, stats_path=STATS_PATH):
+        super().__init__()
+        self.stats_path = stats_path
+        self.views = {}  # view -> _ViewState
+        self.stats = self._load_stats()
+
+        self._ping_timer = QTimer(self)
+        self._ping_timer.setInterval(PING_INTERVAL_MS)
+        self._ping_timer.timeout.connect(self._ping_all)
+        self._ping_timer.start()
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(2000)
+        self._save_timer.timeout.connect(self.save_stats)
+
+    # ---------------- Registration ----------------
+    def watch(self, view: QWebEngineView):
+        if view in self.views:
+            return
+        self.views[view] = _ViewState()
+        page = view.page()
+        page.renderProcessTerminated.connect(lambda status, code, v=view: self._on_terminated(v, status, code))
+        view.loadStarted.connect(lambda v=view: self._on_load_started(v))
+        view.loadFinished.connect(lambda _ok, v=view: self._set_loading(v, False))
+        view.destroyed.connect(lambda *_, v=view: self.views.pop(v, None))
+
+    # ---------------- Crashes ----------------
+    def _on_terminated(self, view, status, exit_code):
+        state = self.views.get(view)
+        if state is None or status == QWebEnginePage.NormalTerminationStatus:
+            return
+        now = time.monotonic()
+        state.crash_times = [t for t in state.crash_times if now - t < CRASH_WINDOW_S] + [now]
+        state.hung = state.prompted = False
+        state.ping_sent = None
+        self._record(view, "crashes", status=getattr(status, "name", str(status)), exit_code=exit_code)
+        self.stateChanged.emit(view, "crashed")
+
+        if len(state.crash_times) >= CRASH_LOOP_LIMIT:
+            print(f"Renderer for {view.url().toString()} crashed {len(state.crash_times)} times; not reloading")
+            self.stateChanged.emit(view, "gave_up")
+            return
+        delay = min(RELOAD_MAX_MS, RELOAD_BASE_MS * 2 ** (len(state.crash_times) - 1))
+        QTimer.singleShot(delay, lambda v=view: self._reload(v))
+
+    def _reload(self, view):
+        if view not in self.views:
+            return  # closed while waiting
+        self.stateChanged.emit(view, "reloading")
+        view.reload()
+
+    def reset(self, view):
+        """Forget crash history (e.g. after the user reloads a given-up tab)."""
+        state = self.views.get(view)
+        if state:
+            state.crash_times.clear()
+
+    # ---------------- Hangs ----------------
+    def _on_load_started(self, view):
+        self._set_loading(view, True)
+
+    def _set_loading(self, view, loading):
+        state = self.views.get(view)
+        if state:
+            state.load_started = time.monotonic() if loading else None
+            state.ping_sent = None  # a navigation drops any outstanding script
+            state.missed = 0
+
+    @staticmethod
+    def _may_be_blocked(view, page):
+        """
+        Pages that are healthy but can't answer scripts: hidden ones may be frozen
+        (monocle / background tabs), inspected ones may sit at a breakpoint.
+        """
+        return not view.isVisible() or page.devToolsPage() is not None or page.inspectedPage() is not None
+
+    def _ping_all(self):
+        # alert/confirm/prompt/beforeunload dialogs (and our own prompt) are modal
+        # and block their renderer; don't count that time as a hang.
+        modal = QApplication.activeModalWidget() is not None
+        now = time.monotonic()
+        for view, state in list(self.views.items()):
+            page = view.page()
+            young_load = state.load_started is not None and now - state.load_started < LOAD_GRACE_S
+            if modal or young_load or self._may_be_blocked(view, page):
+                state.ping_sent = None
+                state.missed = 0
+                continue
+            if state.ping_sent is None:
+                state.ping_seq += 1
+                state.ping_sent = now
+                seq = state.ping_seq
+                page.runJavaScript("0", 0, lambda _r, v=view, s=seq: self._on_pong(v, s))
+                continue
+            state.missed += 1
+            if not state.hung and state.missed >= HANG_MISSED_PINGS:
+                state.hung = True
+                self._record(view, "hangs")
+                self.stateChanged.emit(view, "unresponsive")
+            if state.hung and not state.prompted and state.missed >= PROMPT_MISSED_PINGS:
+                state.prompted = True
+                QTimer.singleShot(0, lambda v=view: self._offer_kill(v))
+
+    def _on_pong(self, view, seq):
+        state = self.views.get(view)
+        if state is None or seq != state.ping_seq:
+            return
+        state.ping_sent = None
+        state.missed = 0
+        if state.hung:
+            state.hung = state.prompted = False
+            self.stateChanged.emit(view, "responsive")
+
+    def _offer_kill(self, view):
+        state = self.views.get(view)
+        if state is None or not state.hung:
+            return
+        answer = QMessageBox.question(
+            view.window(), "Page unresponsive",
+            f"{view.title() or view.url().host()} is not responding.\n\nKill its renderer and reload?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        # It may have recovered while the dialog was open
+        if answer == QMessageBox.Yes and self.views.get(view) is state and state.hung:
+            self.kill_renderer(view)
+
+    def kill_renderer(self, view):
+        pid = view.page().renderProcessPid()
+        if pid <= 0:
+            return
+        self._record(view, "kills")
+        try:
+            os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+        except OSError as e:
+            print("Failed to kill renderer:", e)
+
+    # ---------------- Stats ----------------
+    def _record(self, view, counter, **extra):
+        site = view.url().host() or view.url().scheme() or "unknown"
+        entry = self.stats.setdefault(site, {"crashes": 0, "hangs": 0, "kills": 0})
+        entry[counter] = entry.get(counter, 0) + 1
+        entry["last_event"] = counter
+        entry["last_seen"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        if extra:
+            entry["last_detail"] = extra
+        self._save_timer.start()
+
+    def _load_stats(self):
+        if not os.path.exists(self.stats_path):
+            return {}
+        try:
+            with open(self.stats_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print("Failed to load crash stats:", e)
+            return {}
+
+    def save_stats(self):
+        self._save_timer.stop()
+        try:
+            with open(self.stats_path, "w", encoding="utf-8") as f:
+                json.dump(self.stats, f, indent=2, sort_keys=True)
+        except Exception as e:
+            print("Failed to save crash stats:", e)
+
+
+_supervisor = None
+
+
+def render_supervisor():
+    """Shared supervisor instance (created on first use, needs a QApplication)."""
+    global _supervisor
+    if _supervisor is None:
+        _supervisor = RenderSupervisor()
+    return _supervisor
@@ -0,0 +1,155 @@
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from PySide6.QtCore import QObject, QTimer
+from LoadMetrics import Histogram
+
+STALLS_PATH = os.path.join(os.path.dirname(__file__), "stalls.json")
+HEARTBEAT_MS = 20
+STALL_BUCKETS_MS = [50, 100, 200, 400, 800, 1600, 3200, 6400]
+
+
+def stall_threshold_ms():
+    """Threshold from TYLE_STALL_MS, or None when the watchdog is disabled."""
+    value = os.environ.get("TYLE_STALL_MS", "")
+    return int(value) if value.isdigit() and int(value) > 0 else None
+
+
+class StallWatchdog(QObject):
+    """
+    GUI event-loop stall detector.
+    A QTimer heartbeat on the GUI thread stamps the time every HEARTBEAT_MS;
+    a background thread notices when the stamp is more than `threshold_ms`
+    late and grabs the GUI thread's Python stack while it is still stuck.
+    When the heartbeat resumes, the stall is logged with that stack and the
+    operations (shortcut names) that ran since the previous beat, and added
+    to the per-operation histograms. A stack ending in a Qt call means the
+    time went to Qt/Chromium rather than Python.
+    """
+
+    def __init__(self, threshold_ms=50, path=STALLS_PATH):
+        super().__init__()
+        self.threshold = threshold_ms / 1000.0
+        self.path = path
+        self.histograms = {}        # operation -> Histogram of stall durations (ms)
+        self.stall_count = 0
+
+        self._gui_ident = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._ops = []              # operations entered since the last beat
+        self._current_op = None
+        self._captured = None       # (beat, op, stack) grabbed by the watcher for the ongoing stall
+        self._stop = threading.Event()
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(HEARTBEAT_MS)
+        self._timer.timeout.connect(self._beat)
+        self._timer.start()
+
+        self._thread = threading.Thread(target=self._watch, name="StallWatchdog", daemon=True)
+        self._thread.start()
+
+    # ---------------- Operations ----------------
+    @contextmanager
+    def operation(self, name: str):
+        self._ops.append(name)
+        prev, self._current_op = self._current_op, name
+        try:
+            yield
+        finally:
+            self._current_op = prev
+
+    # ---------------- GUI thread ----------------
+    def _beat(self):
+        now = time.monotonic()
+        beat = self._last_beat
+        late = now - beat - HEARTBEAT_MS / 1000.0
+        self._last_beat = now
+        ops, self._ops = self._ops, []
+        captured, self._captured = self._captured, None
+        if captured and captured[0] != beat:
+            captured = None  # grabbed for an earlier stall; its stack says nothing about this one
+        if late <= self.threshold:
+            return
+
+        stall_ms = late * 1000
+        op = (captured[1] if captured and captured[1] else None) or (ops[-1] if ops else "idle")
+        self.stall_count += 1
+        self.histograms.setdefault(op, Histogram(STALL_BUCKETS_MS)).add(stall_ms)
+
+        print(f"GUI stall {stall_ms:.0f} ms during {op}" + (f" (ops: {', '.join(ops)})" if len(ops) > 1 else ""))
+        if captured:
+            print("".join(captured[2]).rstrip())
+        else:
+            print("  (no Python stack captured: GUI thread held the GIL for the whole stall)")
+
+    # ---------------- Watcher thread ----------------
+    def _watch(self):
+        poll = min(self.threshold / 2, 0.01)
+        stalled_since = None
+        while not self._stop.wait(poll):
+            beat = self._last_beat
+            late = time.monotonic() - beat - HEARTBEAT_MS / 1000.0
+            if late <= self.threshold:
+                stalled_since = None
+                continue
+            if stalled_since == beat:
+                continue  # already captured this stall
+            stalled_since = beat
+            frame = sys._current_frames().get(self._gui_ident)
+            if frame is not None:
+                self._captured = (beat, self._current_op, traceback.format_stack(frame))
+
+    def stop(self):
+        self._stop.set()
+        self._timer.stop()
+
+    # ---------------- Export ----------------
+    def to_dict(self):
+        return {
+            "threshold_ms": int(self.threshold * 1000),
+            "bucket_edges_ms": STALL_BUCKETS_MS,
+            "stalls": self.stall_count,
+            "operations": {op: h.to_dict() for op, h in sorted(self.histograms.items())},
+        }
+
+    def export(self):
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, indent=2)
+        except Exception as e:
+            print("Failed to export stall histograms:", e)
+
+
+_watchdog = None
+
+
+def stall_watchdog():
+    """Shared watchdog, or None when TYLE_STALL_MS is not set. Create on the GUI thread."""
+    global _watchdog
+    if _watchdog is None and stall_threshold_ms():
+        _watchdog = StallWatchdog(stall_threshold_ms())
+    return _watchdog
+
+
+@contextmanager
+def operation(name: str):
+    """Label the work done inside this block for stall reports (no-op when disabled)."""
+    wd = stall_watchdog()
+    if wd is None:
+        yield
+    else:
+        with wd.operation(name):
+            yield
+
+
+def labelled(name: str, callback):
+    """Wrap a callback so anything it does is reported under `name`."""
+    def run(*args):
+        with operation(name):
+            return callback(*args)
+    return run
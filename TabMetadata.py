@@ -0,0 +1,194 @@
+import hashlib
+import json
+import os
+from PySide6.QtCore import QObject, QUrl, QTimer, QBuffer, QByteArray, QIODevice, QSize
+from PySide6.QtGui import QIcon
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "cache")
+INDEX_PATH = os.path.join(CACHE_DIR, "tab_index.json")
+FAVICON_DIR = os.path.join(CACHE_DIR, "favicons")
+
+MAX_ENTRIES = 5000      # oldest entries are dropped past this
+SAVE_DELAY_MS = 2000    # debounce index writes
+
+
+class TabMetadataCache(QObject):
+    """
+    Title + favicon cache keyed by URL.
+    Titles live in a compact JSON index ({url: [title, icon_hash]}),
+    favicons are stored once per content hash as PNG files.
+    """
+
+    def __init__(self, index_path=INDEX_PATH, favicon_dir=FAVICON_DIR):
+        super().__init__()
+        self.index_path = index_path
+        self.favicon_dir = favicon_dir
+        self.entries = {}
+        self._icons = {}  # hash -> QIcon, loaded lazily
+        self._sweep_needed = False  # some favicon may no longer be referenced
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.save)
+
+        self._load()
+
+    # ---------------- Lookup ----------------
+    @staticmethod
+    def _key(url):
+        if isinstance(url, QUrl):
+            url = url.toString()
+        return url or ""
+
+    def title(self, url):
+        entry = self.entries.get(self._key(url))
+        return entry[0] if entry and entry[0] else None
+
+    def icon(self, url):
+        entry = self.entries.get(self._key(url))
+        if not entry or not entry[1]:
+            return None
+        icon_hash = entry[1]
+        if icon_hash not in self._icons:
+            path = os.path.join(self.favicon_dir, f"{icon_hash}.png")
+            if not os.path.exists(path):
+                return None
+            self._icons[icon_hash] = QIcon(path)
+        return self._icons[icon_hash]
+
+    def label(self, url):
+        """Best label for a tab: cached title, else host, else 'New Tab'."""
+        return self.title(url) or QUrl(self._key(url)).host() or "New Tab"
+
+    # ---------------- Updates ----------------
+    def _entry(self, key):
+        entry = self.entries.pop(key, None) or ["", ""]
+        self.entries[key] = entry  # re-insert so recently used stay last
+        while len(self.entries) > MAX_ENTRIES:
+            self.entries.pop(next(iter(self.entries)))
+            self._sweep_needed = True
+        return entry
+
+    def set_title(self, url, title):
+        key = self._key(url)
+        if not key:
+            return
+        if not title or title == key:
+            # Page has no <title> of its own; drop anything carried over to this URL
+            entry = self.entries.get(key)
+            if entry and entry[0]:
+                entry[0] = ""
+                self._schedule_save()
+            return
+        entry = self._entry(key)
+        if entry[0] != title:
+            entry[0] = title
+            self._schedule_save()
+
+    def set_icon(self, url, icon: QIcon):
+        key = self._key(url)
+        if not key or icon is None or icon.isNull():
+            return
+        data = self._icon_to_png(icon)
+        if not data:
+            return
+        icon_hash = hashlib.sha1(data).hexdigest()
+        path = os.path.join(self.favicon_dir, f"{icon_hash}.png")
+        if not os.path.exists(path):
+            try:
+                os.makedirs(self.favicon_dir, exist_ok=True)
+                with open(path, "wb") as f:
+                    f.write(data)
+            except Exception as e:
+                print("Failed to store favicon:", e)
+                return
+        self._icons.setdefault(icon_hash, icon)
+        entry = self._entry(key)
+        if entry[1] != icon_hash:
+            if entry[1]:
+                self._sweep_needed = True
+            entry[1] = icon_hash
+            self._schedule_save()
+
+    def copy(self, old_url, new_url):
+        """
+        Carry metadata across a redirect / in-page navigation if the new URL has none.
+        Only within the same host, so another site never inherits this one's title or icon.
+        """
+        old_key, new_key = self._key(old_url), self._key(new_url)
+        if not old_key or not new_key or old_key == new_key or new_key in self.entries:
+            return
+        if QUrl(old_key).host() != QUrl(new_key).host():
+            return
+        old = self.entries.get(old_key)
+        if old:
+            self.entries[new_key] = list(old)
+            self._schedule_save()
+
+    @staticmethod
+    def _icon_to_png(icon: QIcon):
+        sizes = icon.availableSizes()
+        pixmap = icon.pixmap(max(sizes, key=lambda s: s.width()) if sizes else QSize(32, 32))
+        if pixmap.isNull():
+            return None
+        buf = QByteArray()
+        device = QBuffer(buf)
+        device.open(QIODevice.WriteOnly)
+        pixmap.save(device, "PNG")
+        device.close()
+        return bytes(buf.data())
+
+    # ---------------- Persistence ----------------
+    def _schedule_save(self):
+        self._save_timer.start()
+
+    def _load(self):
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.entries = {k: [v[0], v[1]] for k, v in data.items() if isinstance(v, list) and len(v) == 2}
+        except Exception as e:
+            print("Failed to load tab metadata:", e)
+            self.entries = {}
+
+    def _sweep_favicons(self):
+        """Delete favicon files no entry refers to any more."""
+        self._sweep_needed = False
+        if not os.path.isdir(self.favicon_dir):
+            return
+        referenced = {entry[1] for entry in self.entries.values() if entry[1]}
+        for name in os.listdir(self.favicon_dir):
+            icon_hash, ext = os.path.splitext(name)
+            if ext == ".png" and icon_hash not in referenced:
+                try:
+                    os.remove(os.path.join(self.favicon_dir, name))
+                except OSError as e:
+                    print("Failed to remove favicon:", e)
+                self._icons.pop(icon_hash, None)
+
+    def save(self):
+        self._save_timer.stop()
+        if self._sweep_needed:
+            self._sweep_favicons()
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            tmp = self.index_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, separators=(",", ":"), ensure_ascii=False)
+            os.replace(tmp, self.index_path)
+        except Exception as e:
+            print("Failed to save tab metadata:", e)
+
+
+_cache = None
+
+
+def metadata_cache():
+    """Shared cache instance (created on first use, needs a QApplication)."""
+    global _cache
+    if _cache is None:
+        _cache = TabMetadataCache()
+    return _cache
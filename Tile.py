@@ -1,12 +1,18 @@
 from PySide6.QtWidgets import QTabWidget, QWidget, QVBoxLayout
-from PySide6.QtCore import Qt, QUrl
+from PySide6.QtCore import Qt, QUrl, QTimer
 from PySide6.QtWebEngineWidgets import QWebEngineView
+import shiboken6
 import Workspace  # import the class, not the module
+from TabMetadata import metadata_cache
+from LeakTracker import track
+from RenderSupervisor import render_supervisor
+from LoadMetrics import load_metrics
 
 
 class Tile(QWidget):
     def __init__(self, urls=None):
         super().__init__()
+        track(self, "Tile")
         self.setObjectName("Tile")
         self.setProperty("isActiveTile", False)
 
@@ -24,6 +30,9 @@ class Tile(QWidget):
         layout.addWidget(self.tabs)
 
         self.on_empty = None  # Workspace will assign this callback
+        self.on_activate = None  # Workspace assigns this too; called when the tile is clicked
+        self.tabs.tabBarClicked.connect(lambda _: self.on_activate() if callable(self.on_activate) else None)
+        render_supervisor().stateChanged.connect(self._on_render_state)
 
         # Default tab behavior
         if urls is None:
@@ -35,24 +44,99 @@ class Tile(QWidget):
 
     # ---------------- Events ----------------
     def mousePressEvent(self, event):
-        # Walk up until we find a parent with "set_active_tile"
-        parent = self.parentWidget()
-        while parent is not None and not hasattr(parent, "set_active_tile"):
-            parent = parent.parentWidget()
-        if parent is not None and hasattr(parent, "set_active_tile"):
-            parent.set_active_tile(self)
+        if callable(self.on_activate):
+            self.on_activate()
         super().mousePressEvent(event)
 
     # ---------------- Tabs ----------------
     def add_tab(self, url="https://www.google.com"):
         browser = QWebEngineView()
+        track(browser, "QWebEngineView")
+        track(browser.page(), "QWebEnginePage")
+        load_metrics().attach(browser)
+        load_metrics().mark_navigation(browser)
         browser.setUrl(QUrl(url))
-        tab_index = self.tabs.addTab(browser, QUrl(url).host() or "New Tab")
+        cache = metadata_cache()
+        tab_index = self.tabs.addTab(browser, cache.label(url))
+        icon = cache.icon(url)
+        if icon:
+            self.tabs.setTabIcon(tab_index, icon)
+
+        # Keep the metadata cache (and this tab's label) in sync with the page
+        browser.titleChanged.connect(lambda title, b=browser: self._on_title_changed(b, title))
+        browser.iconChanged.connect(lambda icon, b=browser: self._on_icon_changed(b, icon))
+        browser.urlChanged.connect(lambda new_url, b=browser: self._on_url_changed(b, new_url))
+        browser.setProperty("lastUrl", url)
+        render_supervisor().watch(browser)
         self.tabs.setCurrentIndex(tab_index)
         if self.property("isActiveTile"):
             browser.setFocus()
         return tab_index
 
+    def add_devtools_tab(self, inspected: QWebEngineView):
+        """Open a DevTools tab attached to another tab's page."""
+        devtools = QWebEngineView()
+        track(devtools, "QWebEngineView")
+        track(devtools.page(), "QWebEnginePage")
+        devtools.setProperty("isDevTools", True)
+        devtools.page().setInspectedPage(inspected.page())
+        # Nothing left to inspect once the page's tab is closed
+        inspected.destroyed.connect(lambda *_: QTimer.singleShot(0, lambda: self._close_view(devtools)))
+        tab_index = self.tabs.addTab(devtools, f"DevTools - {inspected.title() or inspected.url().host()}")
+        self.tabs.setCurrentIndex(tab_index)
+        return tab_index
+
+    def _on_title_changed(self, browser, title):
+        metadata_cache().set_title(browser.url(), title)
+        idx = self.tabs.indexOf(browser)
+        if idx != -1 and title:
+            self.tabs.setTabText(idx, title)
+            self.tabs.setTabToolTip(idx, title)
+
+    def _on_icon_changed(self, browser, icon):
+        metadata_cache().set_icon(browser.url(), icon)
+        idx = self.tabs.indexOf(browser)
+        if idx != -1 and not icon.isNull():
+            self.tabs.setTabIcon(idx, icon)
+
+    def _on_url_changed(self, browser, url):
+        cache = metadata_cache()
+        cache.copy(browser.property("lastUrl"), url)
+        browser.setProperty("lastUrl", url.toString())
+        idx = self.tabs.indexOf(browser)
+        if idx == -1:
+            return
+        # Use whatever we already know about the new URL until the page reports its own
+        self.tabs.setTabText(idx, cache.label(url))
+        icon = cache.icon(url)
+        if icon:
+            self.tabs.setTabIcon(idx, icon)
+
+    def _on_render_state(self, browser, state):
+        idx = self.tabs.indexOf(browser)
+        if idx == -1:
+            return
+        label = browser.title() or metadata_cache().label(browser.url())
+        prefix = {
+            "crashed": "(crashed) ",
+            "gave_up": "(crashed) ",
+            "unresponsive": "(not responding) ",
+        }.get(state, "")
+        self.tabs.setTabText(idx, prefix + label)
+
+    def reload(self):
+        current_browser = self.tabs.currentWidget()
+        if current_browser:
+            render_supervisor().reset(current_browser)
+            current_browser.reload()
+
+    def _close_view(self, view):
+        if not shiboken6.isValid(self) or not shiboken6.isValid(view):
+            return
+        idx = self.tabs.indexOf(view)
+        if idx != -1:
+            self.close_tab(idx)
+
     def close_tab(self, index: int):
         """Close the tab at index, and remove tile if none remain."""
         if index < 0 or index >= self.tabs.count():
@@ -111,13 +195,17 @@ class Tile(QWidget):
         urls = []
         for i in range(self.tabs.count()):
             view = self.tabs.widget(i)
-            if view:
+            if view and not view.property("isDevTools"):
                 url = view.url().toString()
                 if url:
                     urls.append(url)
         return {"tabs": urls}
 
     def load_from_dict(self, data):
-        self.tabs.clear()
+        # QTabWidget.clear() only removes tabs; the views themselves must be deleted
+        while self.tabs.count():
+            w = self.tabs.widget(0)
+            self.tabs.removeTab(0)
+            w.deleteLater()
         for url in data.get("tabs", []) or []:
             self.add_tab(url)
\ No newline at end of file
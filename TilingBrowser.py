@@ -4,6 +4,13 @@ from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QP
 from PySide6.QtGui import QPixmap, QKeySequence, QShortcut, QIcon
 from PySide6.QtCore import Qt, QUrl, QTimer
 from Workspace import Workspace
+from Tile import Tile
+from DevTools import TraceCapture
+from DownloadManager import DownloadManager, DownloadPanel
+from TabMetadata import metadata_cache
+from RenderSupervisor import render_supervisor
+from LoadMetrics import load_metrics
+from StallWatchdog import stall_watchdog, operation, labelled
 
 SESSION_PATH = os.path.join(os.path.dirname(__file__), "session.json")
 
@@ -11,6 +18,7 @@ SESSION_PATH = os.path.join(os.path.dirname(__file__), "session.json")
 class TilingBrowser(QMainWindow):
     def __init__(self):
         super().__init__()
+        stall_watchdog()  # start the heartbeat early so session restore is covered
         self.setWindowTitle("Tyle Browser")
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
@@ -40,6 +48,11 @@ class TilingBrowser(QMainWindow):
         self.workspace_area = QVBoxLayout()
         self.layout.addLayout(self.workspace_area)
 
+        # Downloads are profile-wide, so one panel sits under whichever workspace is shown
+        self.download_manager = DownloadManager()
+        self.download_panel = DownloadPanel(self.download_manager)
+        self.layout.addWidget(self.download_panel)
+
         self.workspaces = {}
         self.current_workspace = None
         self.current_workspace_idx = 1
@@ -55,7 +68,7 @@ class TilingBrowser(QMainWindow):
                 QPushButton:hover { background-color: #00aaff; }
                 QPushButton:checked { background-color: #00aaff; }
             """)
-            btn.clicked.connect(lambda _, idx=i: self.switch_workspace(idx))
+            btn.clicked.connect(labelled(f"Ctrl+{i}", lambda _, idx=i: self.switch_workspace(idx)))
             self.topbar.addWidget(btn)
             self.workspace_buttons[i] = btn
 
@@ -63,14 +76,15 @@ class TilingBrowser(QMainWindow):
         self.tiling_buttons = {
             "horizontal": QPushButton("H"),
             "vertical": QPushButton("V"),
-            "bsp": QPushButton("B")
+            "bsp": QPushButton("B"),
+            "monocle": QPushButton("M")
         }
         for mode, btn in self.tiling_buttons.items():
             btn.setFixedSize(24, 24)
             btn.setCheckable(True)
             btn.setProperty("class", "tilingBtn")  # so stylesheet applies
             btn.setObjectName(f"tilingBtn_{mode}")
-            btn.clicked.connect(lambda _, m=mode: self.set_tiling_mode(m))
+            btn.clicked.connect(labelled(f"button:{mode}", lambda _, m=mode: self.set_tiling_mode(m)))
             self.topbar.addWidget(btn)
 
         self.topbar.addStretch()
@@ -93,24 +107,8 @@ class TilingBrowser(QMainWindow):
         self.close_btn.setFixedSize(24, 24); self.close_btn.clicked.connect(self.close); self.topbar.addWidget(self.close_btn)
 
         # Initialize workspaces (load or create)
-        loaded = self._load_session()
-        if loaded:
-            # build from saved state
-            for idx_str, ws_data in loaded.get("workspaces", {}).items():
-                idx = int(idx_str)
-                ws = Workspace()
-                ws.load_from_dict(ws_data)
-                self.workspaces[idx] = ws
-            # Ensure we have 1..4 keys
-            for i in range(1, 5):
-                if i not in self.workspaces:
-                    self.workspaces[i] = Workspace()
-            start_idx = max(1, min(4, int(loaded.get("current_workspace_idx", 1))))
-            self.switch_workspace(start_idx)
-        else:
-            for i in range(1, 5):
-                self.workspaces[i] = Workspace()
-            self.switch_workspace(1)
+        with operation("session_restore"):
+            self._restore_workspaces()
 
         # Floating Search Bar
         self.search_bar = QLineEdit(self)
@@ -127,13 +125,18 @@ class TilingBrowser(QMainWindow):
             "Ctrl+Shift+T": self.add_new_tile,
             "Ctrl+Tab": self.next_tab,
             "Ctrl+Shift+Tab": self.prev_tab,
-            "Alt+Shift+Left": lambda: self.current_workspace.move_focus(-1) if self.current_workspace else None,
-            "Alt+Shift+Right": lambda: self.current_workspace.move_focus(1) if self.current_workspace else None,
+            "Alt+Shift+Left": lambda: self.current_workspace.focus_direction("left") if self.current_workspace else None,
+            "Alt+Shift+Right": lambda: self.current_workspace.focus_direction("right") if self.current_workspace else None,
+            "Alt+Shift+Up": lambda: self.current_workspace.focus_direction("up") if self.current_workspace else None,
+            "Alt+Shift+Down": lambda: self.current_workspace.focus_direction("down") if self.current_workspace else None,
             "Alt+Left": self.go_back,
             "Alt+Right": self.go_forward,
+            "F5": self.reload,
             "Ctrl+Shift+H": lambda: self.set_tiling_mode("horizontal"),
             "Ctrl+Shift+V": lambda: self.set_tiling_mode("vertical"),
             "Ctrl+Shift+B": lambda: self.set_tiling_mode("bsp"),
+            "Ctrl+Shift+M": lambda: self.set_tiling_mode("monocle"),
+            "Ctrl+Shift+Z": self.toggle_zoom,
             "Ctrl+Alt+Left": lambda: self.current_workspace.swap_tile(-1) if self.current_workspace else None,
             "Ctrl+Alt+Right": lambda: self.current_workspace.swap_tile(1) if self.current_workspace else None,
             "Ctrl+Alt+Up": lambda: self.current_workspace.resize_active_tile(30) if self.current_workspace else None,
@@ -142,11 +145,35 @@ class TilingBrowser(QMainWindow):
             "Ctrl+Shift+Right": lambda: self.current_workspace.move_tile("right") if self.current_workspace else None,
             "Ctrl+Shift+Up":    lambda: self.current_workspace.move_tile("up")    if self.current_workspace else None,
             "Ctrl+Shift+Down":  lambda: self.current_workspace.move_tile("down")  if self.current_workspace else None,
+            "Ctrl+Alt+P": lambda: self.capture_trace("profile"),
+            "Ctrl+Alt+Shift+P": lambda: self.capture_trace("trace"),
+            "Ctrl+Shift+I": self.open_devtools,
+            "Ctrl+J": self.download_panel.toggle,
         }
         for i in range(1, 5):
             keybinds[f"Ctrl+{i}"] = lambda idx=i: self.switch_workspace(idx)
         for key, callback in keybinds.items():
-            sc = QShortcut(QKeySequence(key), self); sc.activated.connect(callback); self.shortcuts[key] = sc
+            sc = QShortcut(QKeySequence(key), self); sc.activated.connect(labelled(key, callback)); self.shortcuts[key] = sc
+
+    def _restore_workspaces(self):
+        loaded = self._load_session()
+        if loaded:
+            # build from saved state
+            for idx_str, ws_data in loaded.get("workspaces", {}).items():
+                idx = int(idx_str)
+                ws = Workspace()
+                ws.load_from_dict(ws_data)
+                self.workspaces[idx] = ws
+            # Ensure we have 1..4 keys
+            for i in range(1, 5):
+                if i not in self.workspaces:
+                    self.workspaces[i] = Workspace()
+            start_idx = max(1, min(4, int(loaded.get("current_workspace_idx", 1))))
+            self.switch_workspace(start_idx)
+        else:
+            for i in range(1, 5):
+                self.workspaces[i] = Workspace()
+            self.switch_workspace(1)
 
     # ---------- Window + UI ----------
     def resizeEvent(self, event):
@@ -199,6 +226,10 @@ class TilingBrowser(QMainWindow):
         t = self.current_workspace.active_tile() if self.current_workspace else None
         if t: t.go_forward()
 
+    def reload(self):
+        t = self.current_workspace.active_tile() if self.current_workspace else None
+        if t: t.reload()
+
     def next_tab(self):
         t = self.current_workspace.active_tile() if self.current_workspace else None
         if t and t.tabs.count() > 0:
@@ -229,12 +260,65 @@ class TilingBrowser(QMainWindow):
             target_ws.update_tiles()
 
 
+    # ---------- Debugging ----------
+    def _active_view(self):
+        t = self.current_workspace.active_tile() if self.current_workspace else None
+        return t.tabs.currentWidget() if t else None
+
+    def capture_trace(self, kind="profile"):
+        """Record a CPU profile / trace of the active tab (needs --debug-port)."""
+        view = self._active_view()
+        if not view:
+            return
+        capture = TraceCapture(view, kind, parent=self)
+        capture.finished.connect(lambda path: print(f"Saved {kind} to", path))
+        capture.failed.connect(lambda msg: print(f"Failed to capture {kind}:", msg))
+        print(f"Capturing {kind} of {view.url().toString()} for {capture.seconds}s...")
+        capture.start()
+
+    def open_devtools(self):
+        """Open DevTools for the active tab in a new split tile."""
+        view = self._active_view()
+        if not view or view.property("isDevTools"):
+            return
+        # A page has at most one inspector; reuse its tile instead of stacking new ones
+        devtools_page = view.page().devToolsPage()
+        if devtools_page is not None and self._focus_page(devtools_page):
+            return
+        t = Tile([])
+        t.add_devtools_tab(view)
+        self.current_workspace.add_tile(tile=t)
+
+    def _focus_page(self, page):
+        """Bring the tab showing page to front (switching workspace if needed); False if none does."""
+        for idx, ws in self.workspaces.items():
+            for tile in ws.tiles:
+                for i in range(tile.tabs.count()):
+                    w = tile.tabs.widget(i)
+                    if hasattr(w, "page") and w.page() is page:
+                        if ws is not self.current_workspace:
+                            self.switch_workspace(idx)
+                        tile.tabs.setCurrentIndex(i)
+                        ws.set_active_tile(tile)
+                        w.setFocus()
+                        return True
+        return False
+
     # ---------- Mode + Workspace ----------
     def set_tiling_mode(self, mode):
-        if self.current_workspace and mode in ["horizontal", "vertical", "bsp"]:
+        if self.current_workspace and mode in ["horizontal", "vertical", "bsp", "monocle"]:
             self.current_workspace.set_tiling_mode(mode)
-            for m, btn in self.tiling_buttons.items():
-                btn.setChecked(m == mode)
+            self._sync_tiling_buttons()
+
+    def toggle_zoom(self):
+        if self.current_workspace:
+            self.current_workspace.toggle_zoom()
+            self._sync_tiling_buttons()
+
+    def _sync_tiling_buttons(self):
+        ws = self.current_workspace
+        for m, btn in self.tiling_buttons.items():
+            btn.setChecked(ws.monocle if m == "monocle" else (m == ws.tiling_mode and not ws.monocle))
 
     def switch_workspace(self, idx):
         if idx not in self.workspaces:
@@ -248,8 +332,7 @@ class TilingBrowser(QMainWindow):
         self.workspace_area.addWidget(self.current_workspace)
         self.current_workspace.update_tiles()
         self.workspace_buttons[idx].setChecked(True)
-        for mode, btn in self.tiling_buttons.items():
-            btn.setChecked(mode == self.current_workspace.tiling_mode)
+        self._sync_tiling_buttons()
 
     # ---------- Search ----------
     def handle_search(self):
@@ -275,6 +358,7 @@ class TilingBrowser(QMainWindow):
             tile.add_tab(text)
         else:
             current_browser = tile.tabs.currentWidget()
+            load_metrics().mark_navigation(current_browser)
             current_browser.setUrl(QUrl(text))
 
         QTimer.singleShot(100, lambda: self.search_bar.setVisible(False))
@@ -291,6 +375,11 @@ class TilingBrowser(QMainWindow):
         except Exception as e:
             # Log silently for now; keep MVP minimal
             print("Failed to save session:", e)
+        metadata_cache().save()
+        render_supervisor().save_stats()
+        load_metrics().export()
+        if stall_watchdog():
+            stall_watchdog().export()
 
     def _load_session(self):
         if not os.path.exists(SESSION_PATH):
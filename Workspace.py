@@ -1,6 +1,10 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QSplitter
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QSplitter, QApplication
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWebEngineCore import QWebEnginePage
+import shiboken6
 from Tile import Tile
+from LeakTracker import track, leak_tracker, structural_change
+from GeometryIndex import GeometryIndex
 
 
 class Workspace(QWidget):
@@ -11,12 +15,26 @@ class Workspace(QWidget):
         self.layout.setSpacing(0)
 
         self.tiling_mode = "horizontal"
-        self.root_splitter = QSplitter(Qt.Horizontal)
+        self.root_splitter = track(QSplitter(Qt.Horizontal), "QSplitter")
         self.layout.addWidget(self.root_splitter)
+        if leak_tracker():
+            leak_tracker().register_workspace(self)
 
         self.tiles = []
         self.active_tile_index = 0
 
+        # Tile rectangles for directional focus and click hit-testing
+        self.geometry_index = GeometryIndex(self)
+        self._watch_splitter(self.root_splitter)
+        # Clicking into a page focuses its render widget; one signal per focus change
+        QApplication.instance().focusChanged.connect(self._on_focus_changed)
+
+        # Monocle: only the active tile is shown, the splitter tree stays intact
+        self.monocle = False
+        self._monocle_hidden = set()  # widgets hidden to make room for the active tile
+        self._monocle_tile = None     # tile currently shown in monocle
+        self._frozen_tiles = set()
+
         # start with one tile
         self.add_tile(["https://www.google.com"])
 
@@ -28,6 +46,20 @@ class Workspace(QWidget):
         self.active_tile_index = (self.active_tile_index + direction) % len(self.tiles)
         self._update_tile_visuals(old, self.active_tile_index)
 
+    def focus_direction(self, direction: str):
+        """
+        Focus the nearest tile to the left/right/up/down of the active one.
+        Left/right fall back to cycling when nothing lies that way (e.g. monocle).
+        """
+        tile = self.active_tile()
+        if not tile:
+            return
+        target = self.geometry_index.neighbour(tile, direction)
+        if target is not None:
+            self.set_active_tile(target)
+        elif direction in ("left", "right"):
+            self.move_focus(-1 if direction == "left" else 1)
+
     def active_tile(self):
         return self.tiles[self.active_tile_index] if self.tiles else None
 
@@ -43,21 +75,164 @@ class Workspace(QWidget):
             self.tiles[old_idx].update_stylesheet(False)
         if 0 <= new_idx < len(self.tiles):
             self.tiles[new_idx].update_stylesheet(True)
+            if self.monocle:
+                self._show_only(self.tiles[new_idx])
             w = self.tiles[new_idx].tabs.currentWidget()
             (w or self.tiles[new_idx]).setFocus()
 
+    # ---------------- Geometry ----------------
+    def _watch_splitter(self, splitter: QSplitter):
+        if splitter.property("geometryIndexed"):
+            return
+        splitter.setProperty("geometryIndexed", True)
+        splitter.splitterMoved.connect(lambda _pos, _idx, s=splitter: self.geometry_index.update_splitter(s))
+
+    def resizeEvent(self, event):
+        self.geometry_index.invalidate()
+        super().resizeEvent(event)
+
+    def showEvent(self, event):
+        self.geometry_index.invalidate()
+        super().showEvent(event)
+
+    def _on_focus_changed(self, _old, now):
+        """Activate the tile that received keyboard focus (e.g. from a click into its page)."""
+        if now is None or not self.isAncestorOf(now):
+            return
+        tile = self.geometry_index.tile_at(now.mapTo(self, now.rect().center()))
+        if tile is not None and tile is not self.active_tile():
+            self.set_active_tile(tile)
+
+    def _hook_tile(self, t: Tile):
+        t.on_empty = lambda: self.remove_tile(t)  # hook for deletion
+        t.on_activate = lambda: self.set_active_tile(t) if t is not self.active_tile() else None
+
+    # ---------------- Monocle / zoom ----------------
+    def toggle_zoom(self):
+        """Zoom the active tile to fill the workspace, or restore the layout."""
+        self.set_monocle(not self.monocle)
+
+    def set_monocle(self, enabled: bool):
+        if enabled == self.monocle:
+            return
+        self.monocle = enabled
+        if enabled:
+            tile = self.active_tile()
+            if tile:
+                self._show_only(tile)
+        else:
+            self._restore_hidden()
+        structural_change(f"set_monocle({enabled})")
+
+    def _show_only(self, tile: Tile):
+        """
+        Hide everything not on the path from root_splitter to tile.
+        Only widgets on the old and new paths change visibility, so switching
+        tiles never rebuilds the tree or touches unrelated hidden tiles.
+        """
+        previous = self._monocle_tile
+        if previous is tile:
+            return
+        if previous is not None and not shiboken6.isValid(previous):
+            previous = None
+
+        # Wake the page before it becomes visible again
+        if tile in self._frozen_tiles:
+            self._frozen_tiles.discard(tile)
+            self._set_tile_frozen(tile, False)
+
+        hidden = self._path_siblings(tile)
+        for w in self._monocle_hidden - hidden:
+            # skip widgets already deleted or detached (showing those would pop up a window)
+            if shiboken6.isValid(w) and w.parentWidget() is not None:
+                w.setVisible(True)
+        for w in hidden - self._monocle_hidden:
+            w.setVisible(False)
+        self._monocle_hidden = hidden
+        self._monocle_tile = tile
+        self.geometry_index.invalidate()
+
+        # Only tiles that just went out of view need freezing
+        newly_hidden = [previous] if previous is not None else [t for t in self.tiles if t is not tile]
+        QTimer.singleShot(0, lambda: self._freeze_hidden(newly_hidden))
+
+    def _path_siblings(self, tile: Tile):
+        """Widgets that must be hidden for tile to fill the workspace."""
+        siblings = set()
+        child, parent = tile, tile.parentWidget()
+        while isinstance(parent, QSplitter):
+            for i in range(parent.count()):
+                w = parent.widget(i)
+                if w is not child and (w in self._monocle_hidden or not w.isHidden()):
+                    siblings.add(w)
+            if parent is self.root_splitter:
+                break
+            child, parent = parent, parent.parentWidget()
+        return siblings
+
+    def _freeze_hidden(self, tiles):
+        # Deferred so the pages have seen the visibility change; Chromium won't freeze visible pages
+        if not self.monocle:
+            return
+        for t in tiles:
+            if (shiboken6.isValid(t) and t is not self._monocle_tile
+                    and t not in self._frozen_tiles and not t.isVisible()):
+                self._set_tile_frozen(t, True)
+                self._frozen_tiles.add(t)
+
+    def _restore_hidden(self):
+        """Undo monocle visibility and wake every frozen tile (leaving monocle)."""
+        self._show_hidden()
+        for t in self._frozen_tiles:
+            if shiboken6.isValid(t):
+                self._set_tile_frozen(t, False)
+        self._frozen_tiles.clear()
+
+    def _show_hidden(self):
+        """Show what monocle hid, leaving frozen pages frozen."""
+        for w in self._monocle_hidden:
+            if shiboken6.isValid(w) and w.parentWidget() is not None:
+                w.setVisible(True)
+        self._monocle_hidden.clear()
+        self._monocle_tile = None
+        self.geometry_index.invalidate()
+
+    def _forget_tile(self, tile: Tile):
+        """Drop monocle bookkeeping for a tile leaving the tree; nothing else is touched."""
+        if tile in self._monocle_hidden:
+            self._monocle_hidden.discard(tile)
+            tile.setVisible(True)  # still parented here; becomes implicitly hidden once taken out
+        if tile in self._frozen_tiles:
+            self._frozen_tiles.discard(tile)
+            self._set_tile_frozen(tile, False)
+        if self._monocle_tile is tile:
+            self._monocle_tile = None
+
+    @staticmethod
+    def _set_tile_frozen(tile: Tile, frozen: bool):
+        """Freeze pages of a hidden tile (unless Chromium wants them active, e.g. playing audio)."""
+        for i in range(tile.tabs.count()):
+            view = tile.tabs.widget(i)
+            if view is None or not hasattr(view, "page"):
+                continue
+            page = view.page()
+            if not frozen:
+                page.setLifecycleState(QWebEnginePage.LifecycleState.Active)
+            elif page.recommendedState() != QWebEnginePage.LifecycleState.Active:
+                page.setLifecycleState(QWebEnginePage.LifecycleState.Frozen)
+
     # ---------------- Tiles ----------------
-    def add_tile(self, urls=None):
+    def add_tile(self, urls=None, tile: Tile = None):
         # If explicit empty list → do not create tile
-        if urls == []:
+        if urls == [] and tile is None:
             return
 
         # Default URL = Google if nothing provided
         if urls is None:
             urls = ["https://www.google.com"]
 
-        t = Tile(urls)
-        t.on_empty = lambda: self.remove_tile(t)  # hook for deletion
+        t = tile or Tile(urls)
+        self._hook_tile(t)
 
         if self.tiling_mode == "bsp":
             self._add_tile_bsp(t)
@@ -70,14 +245,17 @@ class Workspace(QWidget):
                 if not any(sizes):  # if sizes not initialized
                     self.root_splitter.setSizes([1] * len(self.tiles))
 
+        self.geometry_index.invalidate()
         old = self.active_tile_index
         self.active_tile_index = len(self.tiles) - 1
         self._update_tile_visuals(old, self.active_tile_index)
+        structural_change("add_tile")
 
     def remove_tile(self, tile: Tile):
         """Remove a tile if it has no tabs, but keep at least one alive."""
         if tile not in self.tiles:
             return
+        self._forget_tile(tile)
 
         # If this is the only tile, replace with a fresh Google tile
         if len(self.tiles) == 1:
@@ -85,7 +263,9 @@ class Workspace(QWidget):
             if parent:
                 parent_idx = parent.indexOf(tile)
                 parent.widget(parent_idx).setParent(None)
+                self._prune_empty_splitters(parent)
             self.tiles.remove(tile)
+            tile.deleteLater()
 
             # Immediately create a fresh one
             self.add_tile(["https://www.google.com"])
@@ -96,29 +276,46 @@ class Workspace(QWidget):
         if parent:
             parent_idx = parent.indexOf(tile)
             parent.widget(parent_idx).setParent(None)
+            self._prune_empty_splitters(parent)
 
         self.tiles.remove(tile)
+        tile.deleteLater()
+        self.geometry_index.invalidate()
 
         # Adjust focus
         self.active_tile_index = min(self.active_tile_index, len(self.tiles) - 1)
         self._update_tile_visuals(-1, self.active_tile_index)
+        structural_change("remove_tile")
 
     def detach_tile(self, tile: Tile):
         """Detach a tile from this workspace and return it, without deleting."""
         if tile not in self.tiles:
             return None
+        self._forget_tile(tile)
 
         parent = tile.parentWidget()
         if parent:
             parent_idx = parent.indexOf(tile)
             parent.widget(parent_idx).setParent(None)
+            self._prune_empty_splitters(parent)
 
         self.tiles.remove(tile)
+        self.geometry_index.invalidate()
         self.active_tile_index = min(self.active_tile_index, len(self.tiles) - 1)
         self._update_tile_visuals(-1, self.active_tile_index)
+        structural_change("detach_tile")
 
         return tile
 
+    def _prune_empty_splitters(self, splitter):
+        """Delete nested splitters left with no children after a tile was taken out."""
+        while isinstance(splitter, QSplitter) and splitter is not self.root_splitter and splitter.count() == 0:
+            parent = splitter.parentWidget()
+            self._monocle_hidden.discard(splitter)
+            splitter.setParent(None)
+            splitter.deleteLater()
+            splitter = parent
+
 
     def resize_active_tile(self, delta: int):
         """
@@ -154,6 +351,7 @@ class Workspace(QWidget):
                 break
 
         parent.setSizes(new_sizes)
+        self.geometry_index.invalidate()
 
     def update_tiles(self):
         """Rebuild self.tiles list by walking the splitter tree safely."""
@@ -167,12 +365,15 @@ class Workspace(QWidget):
             visited.add(id(w))
 
             if isinstance(w, Tile):
+                self._hook_tile(w)  # restored / moved tiles need this workspace's callbacks
                 self.tiles.append(w)
             elif isinstance(w, QSplitter):
+                self._watch_splitter(w)
                 for i in range(w.count()):
                     walk(w.widget(i))
 
         walk(self.root_splitter)
+        self.geometry_index.invalidate()
 
         if not self.tiles:
             self.add_tile(["https://www.google.com"])
@@ -183,11 +384,18 @@ class Workspace(QWidget):
 
     # ---------------- Mode switching ----------------
     def set_tiling_mode(self, mode: str):
-        if mode not in ("horizontal", "vertical", "bsp") or mode == self.tiling_mode:
+        if mode == "monocle":
+            self.set_monocle(True)
+            return
+        if mode not in ("horizontal", "vertical", "bsp"):
+            return
+        self.set_monocle(False)
+        if mode == self.tiling_mode:
             return
         self._rebuild_layout_preserving_sizes(mode)
         self.tiling_mode = mode
         self.update_tiles()
+        structural_change(f"set_tiling_mode({mode})")
 
     # ---------------- Movement -----------------
     def move_tile(self, direction: str):
@@ -228,6 +436,7 @@ class Workspace(QWidget):
             parent.insertWidget(idx, sibling)
             parent.insertWidget(target_idx, tile)
             parent.setSizes(parent.sizes())  # keep sizes stable
+            self.geometry_index.invalidate()
             return
 
         # If no sibling in this splitter, try climbing up
@@ -242,6 +451,7 @@ class Workspace(QWidget):
                 insert_pos = parent_idx + 1
             grandparent.insertWidget(insert_pos, tile)
             grandparent.setSizes(grandparent.sizes())
+            self.geometry_index.invalidate()
 
 
 
@@ -284,6 +494,10 @@ class Workspace(QWidget):
 
     def _clear_root(self):
         """Safely detach everything under root_splitter."""
+        # Tiles stay frozen; the monocle pass after the rebuild wakes only the active one
+        self._show_hidden()
+        if not self.monocle:
+            self._restore_hidden()
         # Collect current top-level children and recursively detach them
         top_children = [self.root_splitter.widget(i) for i in range(self.root_splitter.count())]
         for ch in top_children:
@@ -359,7 +573,7 @@ class Workspace(QWidget):
         left_node = self._build_bsp_tree(left_tiles, left_w, not start_horizontal)
         right_node = self._build_bsp_tree(right_tiles, right_w, not start_horizontal)
 
-        splitter = QSplitter(Qt.Horizontal if start_horizontal else Qt.Vertical)
+        splitter = track(QSplitter(Qt.Horizontal if start_horizontal else Qt.Vertical), "QSplitter")
         splitter.addWidget(left_node)
         splitter.addWidget(right_node)
         splitter.setSizes([max(1, sum(left_w)), max(1, sum(right_w))])
@@ -381,12 +595,18 @@ class Workspace(QWidget):
     def _serialize_node(self, widget):
         """Turn a widget tree (Tile or QSplitter) into a dict."""
         if isinstance(widget, Tile):
-            return {"type": "tile", **widget.to_dict()}
+            data = widget.to_dict()
+            # Tiles with nothing restorable (e.g. only a DevTools tab) are left out
+            return {"type": "tile", **data} if data["tabs"] else None
         if isinstance(widget, QSplitter):
+            children = [self._serialize_node(widget.widget(i)) for i in range(widget.count())]
+            children = [c for c in children if c is not None]
+            if not children and widget is not self.root_splitter:
+                return None
             return {
                 "type": "splitter",
                 "orientation": "H" if widget.orientation() == Qt.Horizontal else "V",
-                "children": [self._serialize_node(widget.widget(i)) for i in range(widget.count())]
+                "children": children
             }
         return None
 
@@ -394,21 +614,25 @@ class Workspace(QWidget):
         """Export this workspace state to a dict."""
         return {
             "tiling_mode": self.tiling_mode,
+            "monocle": self.monocle,
             "active_tile_index": max(0, min(self.active_tile_index, max(0, len(self.tiles) - 1))),
             "tree": self._serialize_node(self.root_splitter)
         }
 
     def _build_from_node(self, node):
-        """Rebuild widget(s) from a serialized node dict."""
+        """Rebuild widget(s) from a serialized node dict; None for nodes with no tabs."""
         if node["type"] == "tile":
+            if not node.get("tabs"):
+                return None
             t = Tile()
             t.load_from_dict(node)
             return t
         if node["type"] == "splitter":
-            splitter = QSplitter(Qt.Horizontal if node.get("orientation", "H") == "H" else Qt.Vertical)
+            splitter = track(QSplitter(Qt.Horizontal if node.get("orientation", "H") == "H" else Qt.Vertical), "QSplitter")
             for child in node.get("children", []):
                 w = self._build_from_node(child)
-                splitter.addWidget(w)
+                if w is not None:
+                    splitter.addWidget(w)
             return splitter
         return Tile(["https://www.google.com"])
 
@@ -417,14 +641,21 @@ class Workspace(QWidget):
         self.tiling_mode = data.get("tiling_mode", "horizontal")
         self.active_tile_index = int(data.get("active_tile_index", 0))
 
-        # Fully clear existing tree (detach tiles to avoid deletion)
+        # Fully clear existing tree; the tiles being replaced are deleted afterwards
+        old_tiles = self.tiles[:]
         self._clear_root()
+        self._frozen_tiles.difference_update(old_tiles)
+        for t in old_tiles:
+            t.deleteLater()
 
         # Build UI tree
         tree = data.get("tree")
         if tree:
             rebuilt = self._build_from_node(tree)
-            self.root_splitter.addWidget(rebuilt)
+            if rebuilt is not None:
+                self.root_splitter.addWidget(rebuilt)
 
         # Refresh lists
         self.update_tiles()
+        structural_change("load_from_dict")
+        self.set_monocle(bool(data.get("monocle", False)))
@@ -0,0 +1,92 @@
+"""
+Layout churn benchmark: randomized add/remove/mode-switch cycles on one
+Workspace with leak accounting on, asserting the live object counts never
+drift from what the layout says should exist.
+
+    QT_QPA_PLATFORM=offscreen python bench_layout.py --cycles 10000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ["TYLE_LEAK_CHECK"] = "1"
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+from Workspace import Workspace
+from LeakTracker import leak_tracker
+
+BLANK = ["about:blank"]
+MODES = ("horizontal", "vertical", "bsp", "monocle")
+
+
+def run(cycles: int, max_tiles: int, seed: int, check_every: int):
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    rng = random.Random(seed)
+    tracker = leak_tracker()
+
+    ws = Workspace()
+    ws.resize(1280, 800)
+    app.processEvents()
+    tracker.check("warmup")
+    baseline = tracker.snapshot()
+
+    ops = {"add": 0, "remove": 0, "close_tab": 0, "mode": 0, "zoom": 0, "focus": 0}
+    t0 = time.perf_counter()
+    for i in range(1, cycles + 1):
+        r = rng.random()
+        if r < 0.3 and len(ws.tiles) < max_tiles:
+            ws.add_tile(BLANK * rng.randint(1, 2))
+            ops["add"] += 1
+        elif r < 0.5:
+            ws.remove_tile(rng.choice(ws.tiles))
+            ops["remove"] += 1
+        elif r < 0.6:
+            t = rng.choice(ws.tiles)
+            t.close_tab(t.tabs.currentIndex())
+            ops["close_tab"] += 1
+        elif r < 0.8:
+            ws.set_tiling_mode(rng.choice(MODES))
+            ops["mode"] += 1
+        elif r < 0.9:
+            ws.toggle_zoom()
+            ops["zoom"] += 1
+        else:
+            ws.move_focus(rng.choice((-1, 1)))
+            ops["focus"] += 1
+        app.processEvents()
+
+        if i % check_every == 0 or i == cycles:
+            excess = tracker.check(f"cycle {i}")
+            assert not excess, f"leak after cycle {i}: {excess}"
+
+    elapsed = time.perf_counter() - t0
+    # Bring the layout back to its starting shape, then nothing may have grown
+    ws.set_tiling_mode("horizontal")
+    while len(ws.tiles) > 1:
+        ws.remove_tile(ws.tiles[-1])
+    app.processEvents()
+    excess = tracker.check("teardown")
+    assert not excess, f"leak after teardown: {excess}"
+    # The surviving tile may hold one extra tab; tiles and splitters get no slack
+    tracker.assert_no_growth(baseline, slack={"QWebEngineView": 1, "QWebEnginePage": 1})
+
+    print(f"{cycles} cycles in {elapsed:.2f}s ({elapsed * 1e6 / cycles:.0f} us/cycle)")
+    print("ops:", ops)
+    print("live:", tracker.snapshot(), "created:", tracker.created)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cycles", type=int, default=10000)
+    parser.add_argument("--max-tiles", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--check-every", type=int, default=100)
+    args = parser.parse_args()
+    run(args.cycles, args.max_tiles, args.seed, args.check_every)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,49 @@
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon  
+import argparse
+import os
 import sys
 import TilingBrowser
+from DevTools import enable_remote_debugging
+from BatchRenderer import run_batch
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="tyle")
+    parser.add_argument("--debug-port", type=int, default=None,
+                        help="enable Chromium remote debugging on 127.0.0.1:PORT (trace capture, Ctrl+Alt+P)")
+    parser.add_argument("--stall-ms", type=int, default=None, metavar="MS",
+                        help="log GUI event-loop stalls longer than MS with the GUI thread's Python stack")
+    parser.add_argument("--leak-check", action="store_true",
+                        help="count live tiles/views/pages/splitters and report leaks after layout changes")
+
+    batch = parser.add_argument_group("headless batch rendering")
+    batch.add_argument("--batch", metavar="URL_LIST", help="render every URL in this file and exit (no window)")
+    batch.add_argument("--out", default="renders", help="output directory (default: renders)")
+    batch.add_argument("--format", choices=("png", "pdf"), default="png")
+    batch.add_argument("--jobs", type=int, default=4, help="concurrent offscreen pages (default: 4)")
+    batch.add_argument("--timeout", type=float, default=30.0, help="seconds per attempt (default: 30)")
+    batch.add_argument("--retries", type=int, default=1, help="retries per failed page (default: 1)")
+    batch.add_argument("--manifest", default=None, help="results manifest path (default: OUT/manifest.json)")
+    batch.add_argument("--width", type=int, default=1280)
+    batch.add_argument("--height", type=int, default=800)
+    # Everything we don't know about is left for Qt / Chromium
+    return parser.parse_known_args(argv[1:])
 
 
 def main():
-    app = QApplication(sys.argv)
+    args, qt_args = parse_args(sys.argv)
+    if args.debug_port:
+        enable_remote_debugging(args.debug_port)
+    if args.leak_check:
+        os.environ["TYLE_LEAK_CHECK"] = "1"
+    if args.stall_ms:
+        os.environ["TYLE_STALL_MS"] = str(args.stall_ms)
+
+    if args.batch:
+        sys.exit(run_batch(args, sys.argv[:1] + qt_args))
+
+    app = QApplication(sys.argv[:1] + qt_args)
     try:
         app.setWindowIcon(QIcon(r"misc\Tylelogo.ico"))
     except Exception as e: